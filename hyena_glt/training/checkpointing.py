@@ -1,13 +1,375 @@
 """Checkpointing and model management utilities."""
 
+import codecs
+import hashlib
+import io
 import json
 import logging
+import math
+import mmap
+import os
+import pickle
+import queue
 import shutil
+import threading
+import zipfile
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import torch
+import torch.distributed as dist
+
+try:
+    from numpy._core.multiarray import scalar as _numpy_scalar
+except ImportError:  # NumPy < 2
+    from numpy.core.multiarray import scalar as _numpy_scalar
+
+try:
+    import torch.distributed.checkpoint as dcp
+    from torch.distributed.checkpoint.state_dict import (
+        StateDictOptions,
+        get_model_state_dict,
+        get_optimizer_state_dict,
+        set_model_state_dict,
+        set_optimizer_state_dict,
+    )
+
+    HAS_DCP = True
+except ImportError:
+    HAS_DCP = False
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from safetensors import safe_open
+    from safetensors.torch import save_file
+
+    HAS_SAFETENSORS = True
+except ImportError:
+    HAS_SAFETENSORS = False
+
+try:
+    import xxhash
+
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+try:
+    import zstandard as zstd
+
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# Non-tensor training state stored alongside distributed checkpoint shards
+_TRAINER_STATE_FILE = "trainer_state.pt"
+
+# Append-only checkpoint history and the small best-checkpoint record
+_HISTORY_FILE = "checkpoint_history.jsonl"
+_LEGACY_HISTORY_FILE = "checkpoint_history.json"
+_HISTORY_META_FILE = "checkpoint_meta.json"
+
+# Fallback for filesystems without symlinks; names the best checkpoint
+_BEST_POINTER_FILE = "best_checkpoint.txt"
+
+# Checkpoints are written under this suffix, then renamed into place
+_PARTIAL_SUFFIX = ".tmp"
+
+# Index of the per-tensor checkpoint layout; written last to mark completion
+_TENSOR_INDEX_FILE = "meta.json"
+
+# File suffix of each checkpoint format; per-tensor checkpoints are directories
+_FORMAT_SUFFIXES = {"torch": ".pt", "safetensors": ".safetensors", "per_tensor": ""}
+CHECKPOINT_FORMATS = tuple(_FORMAT_SUFFIXES)
+
+# Non-torch globals the metadata unpickler resolves: metrics often hold NumPy
+# scalars, whose raw bytes pickle protocol 2 encodes through _codecs
+_METADATA_GLOBALS: dict[tuple[str, str], Any] = {
+    ("collections", "OrderedDict"): OrderedDict,
+    ("numpy", "dtype"): np.dtype,
+    ("numpy._core.multiarray", "scalar"): _numpy_scalar,
+    ("numpy.core.multiarray", "scalar"): _numpy_scalar,
+    ("_codecs", "encode"): codecs.encode,
+}
+
+# Header metadata key holding the non-tensor state of a safetensors checkpoint
+_SAFETENSORS_STATE_KEY = "state"
+
+# Frame magic of zstd-compressed torch checkpoints
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Optimizer moments that optimizer_dtype may store in reduced precision
+_COMPRESSIBLE_OPTIMIZER_STATE = ("exp_avg", "exp_avg_sq", "max_exp_avg_sq")
+_OPTIMIZER_DTYPES = (torch.bfloat16, torch.float16, torch.int8)
+
+
+def _has_cpu_collectives() -> bool:
+    """Check whether the default process group can reduce CPU tensors."""
+    if hasattr(dist, "get_backend_config"):
+        return "cpu:" in dist.get_backend_config()
+    return dist.get_backend() == dist.Backend.GLOO
+
+
+def _tensor_digest(tensor: torch.Tensor) -> bytes:
+    """Fingerprint the dtype, shape and raw bytes of a CPU tensor."""
+    hasher = xxhash.xxh128() if HAS_XXHASH else hashlib.blake2b(digest_size=16)
+    hasher.update(f"{tensor.dtype}{tuple(tensor.shape)}".encode())
+    hasher.update(tensor.contiguous().reshape(-1).view(torch.uint8).numpy())
+    return hasher.digest()
+
+
+def _compress_optimizer_state(
+    state_dict: dict[str, Any], dtype: torch.dtype
+) -> dict[str, Any]:
+    """Store Adam-style moment tensors of an optimizer state dict in ``dtype``.
+
+    ``torch.int8`` quantizes each tensor with a per-tensor absmax scale stored
+    under ``{name}_scale``. This is lossy; ``step`` and other state are kept.
+    """
+    compressed_state = {}
+    for param_id, param_state in state_dict["state"].items():
+        param_state = dict(param_state)
+        for name in _COMPRESSIBLE_OPTIMIZER_STATE:
+            tensor = param_state.get(name)
+            if not isinstance(tensor, torch.Tensor) or not tensor.is_floating_point():
+                continue
+            if dtype == torch.int8:
+                scale = tensor.abs().max().float().clamp_min(1e-30) / 127
+                param_state[name] = tensor.div(scale).round_().to(torch.int8)
+                param_state[f"{name}_scale"] = scale
+            else:
+                param_state[name] = tensor.to(dtype)
+        compressed_state[param_id] = param_state
+    return {**state_dict, "state": compressed_state}
+
+
+def _decompress_optimizer_state(state_dict: dict[str, Any]) -> dict[str, Any]:
+    """Restore FP32 moment tensors written by :func:`_compress_optimizer_state`."""
+    restored_state = {}
+    for param_id, param_state in state_dict["state"].items():
+        param_state = dict(param_state)
+        for name in _COMPRESSIBLE_OPTIMIZER_STATE:
+            tensor = param_state.get(name)
+            if not isinstance(tensor, torch.Tensor) or tensor.dtype not in (
+                _OPTIMIZER_DTYPES
+            ):
+                continue
+            scale = param_state.pop(f"{name}_scale", None)
+            tensor = tensor.float()
+            param_state[name] = tensor * scale if scale is not None else tensor
+        restored_state[param_id] = param_state
+    return {**state_dict, "state": restored_state}
+
+
+def _populate_page_cache(path: Path) -> None:
+    """Fault a file into the OS page cache without copying it into Python."""
+    size = path.stat().st_size
+    if size == 0:
+        return
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if hasattr(mmap, "MAP_POPULATE"):
+            # MAP_POPULATE reads the whole mapping before mmap() returns
+            with mmap.mmap(
+                fd,
+                size,
+                flags=mmap.MAP_PRIVATE | mmap.MAP_POPULATE,
+                prot=mmap.PROT_READ,
+            ):
+                pass
+        elif hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+
+def _prefetch_to_page_cache(paths: list[Path]) -> None:
+    """Read checkpoint files into the page cache concurrently."""
+    if not paths:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+        for future in [pool.submit(_populate_page_cache, path) for path in paths]:
+            try:
+                future.result()
+            except OSError:
+                # Best effort only; the actual load reports real I/O errors
+                pass
+
+
+def _pipeline_stage(
+    fn: Callable[[Any], Any],
+    inbox: queue.Queue[Any],
+    outbox: queue.Queue[Any],
+    stop: threading.Event,
+    num_sentinels: int = 1,
+) -> None:
+    """Apply ``fn`` to ``inbox`` items until a ``None`` sentinel, forwarding results.
+
+    Failures are forwarded downstream as exception objects. Once ``stop`` is set
+    the stage keeps draining its inbox so upstream stages never block.
+    """
+    for item in iter(inbox.get, None):
+        if isinstance(item, Exception):
+            outbox.put(item)
+            continue
+        if stop.is_set():
+            continue
+        try:
+            outbox.put(fn(item))
+        except Exception as e:
+            stop.set()
+            outbox.put(e)
+    for _ in range(num_sentinels):
+        outbox.put(None)
+
+
+def _encode_state(
+    obj: Any, tensors: dict[str, torch.Tensor] | None = None, key: str = ""
+) -> Any:
+    """Convert nested checkpoint data to JSON-safe values, collecting tensors.
+
+    Tensors are replaced by ``{"__tensor__": key}`` references (when a
+    ``tensors`` dict is given), dicts with non-string keys (e.g. optimizer
+    ``state``) by ``{"__items__": [...]}`` and non-finite floats by
+    ``{"__float__": repr}``.
+    """
+    if tensors is not None and isinstance(obj, torch.Tensor):
+        tensors[key] = obj
+        return {"__tensor__": key}
+    if isinstance(obj, dict):
+        items = [(k, _encode_state(v, tensors, f"{key}/{k}")) for k, v in obj.items()]
+        if all(isinstance(k, str) for k, _ in items):
+            return dict(items)
+        return {"__items__": [[k, v] for k, v in items]}
+    if isinstance(obj, (list, tuple)):
+        return [_encode_state(v, tensors, f"{key}/{i}") for i, v in enumerate(obj)]
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return {"__float__": repr(obj)}
+    return obj
+
+
+def _decode_state(obj: Any, tensors: dict[str, torch.Tensor] | None = None) -> Any:
+    """Invert :func:`_encode_state` given the loaded tensors."""
+    if isinstance(obj, dict):
+        if "__tensor__" in obj and tensors is not None:
+            return tensors[obj["__tensor__"]]
+        if "__float__" in obj:
+            return float(obj["__float__"])
+        if "__items__" in obj:
+            return {k: _decode_state(v, tensors) for k, v in obj["__items__"]}
+        return {k: _decode_state(v, tensors) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_decode_state(v, tensors) for v in obj]
+    return obj
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize NumPy/torch scalars and arrays that JSON has no type for."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as compact JSON, using orjson when it is installed."""
+    obj = _encode_state(obj)
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=_json_default)
+    return json.dumps(obj, default=_json_default).encode()
+
+
+def _json_loads(data: bytes | str) -> Any:
+    """Parse JSON written by :func:`_json_dumps` or by the stdlib encoder.
+
+    Files from older versions may contain bare ``Infinity``/``NaN`` literals,
+    which only the stdlib parser accepts.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _write_tensor_file(tensor: torch.Tensor, path: Path) -> None:
+    """Dump the raw bytes of a tensor."""
+    tensor.cpu().contiguous().reshape(-1).view(torch.uint8).numpy().tofile(path)
+
+
+def _read_tensor_file(path: Path, dtype: str, shape: list[int]) -> torch.Tensor:
+    """Load a tensor written by :func:`_write_tensor_file`."""
+    raw = torch.from_numpy(np.fromfile(path, dtype=np.uint8))
+    return raw.view(getattr(torch, dtype)).reshape(shape)
+
+
+def _skip_tensor(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for torch's tensor rebuild functions; storages are never read."""
+    return None
+
+
+class _MetadataUnpickler(pickle.Unpickler):
+    """Unpickle the ``data.pkl`` record of a torch zip checkpoint without tensors.
+
+    Only the globals a checkpoint dict needs are resolved; anything else raises
+    so the caller can fall back to ``torch.load``.
+    """
+
+    def persistent_load(self, pid: Any) -> None:
+        return None
+
+    def find_class(self, module: str, name: str) -> Any:
+        if module.startswith("torch") and name.startswith("_rebuild"):
+            return _skip_tensor
+        if (module, name) in _METADATA_GLOBALS:
+            return _METADATA_GLOBALS[module, name]
+        if module == "torch" and (
+            name.endswith("Storage")
+            or isinstance(getattr(torch, name, None), torch.dtype)
+        ):
+            return getattr(torch, name)
+        raise pickle.UnpicklingError(f"Global not allowed: {module}.{name}")
+
+
+def _open_torch_file(path: Path) -> Path | io.BytesIO:
+    """Return ``path``, or its decompressed contents if it is zstd-compressed."""
+    with open(path, "rb") as f:
+        if f.read(len(_ZSTD_MAGIC)) != _ZSTD_MAGIC:
+            return path
+        if not HAS_ZSTD:
+            raise ImportError(f"{path} is zstd-compressed; install zstandard")
+        f.seek(0)
+        return io.BytesIO(zstd.ZstdDecompressor().stream_reader(f).read())
+
+
+def _load_torch_file(path: Path, mmap: bool = False) -> Any:
+    """``torch.load`` a checkpoint file; compressed files cannot be mmapped."""
+    source = _open_torch_file(path)
+    if isinstance(source, io.BytesIO):
+        return torch.load(source, map_location="cpu")
+    return torch.load(source, map_location="cpu", mmap=mmap)
+
+
+def _read_torch_metadata(path: Path) -> dict[str, Any]:
+    """Read a ``torch.save`` zip archive with every tensor replaced by ``None``."""
+    with zipfile.ZipFile(_open_torch_file(path)) as archive:
+        record = next(n for n in archive.namelist() if n.endswith("data.pkl"))
+        with archive.open(record) as f:
+            data: dict[str, Any] = _MetadataUnpickler(f).load()
+    return data
 
 
 class CheckpointManager:
@@ -22,7 +384,38 @@ class CheckpointManager:
         minimize_metric: bool = True,
         save_optimizer: bool = True,
         save_scheduler: bool = True,
+        async_save: bool = False,
+        use_pinned: bool = True,
+        use_dcp: bool = False,
+        delta_checkpoints: bool = False,
+        full_every_n: int = 10,
+        checkpoint_format: str = "torch",
+        prefetch_auto: bool = True,
+        optimizer_dtype: torch.dtype | None = None,
+        compress: bool = False,
+        compression_level: int = 3,
     ):
+        if checkpoint_format not in CHECKPOINT_FORMATS:
+            raise ValueError(
+                f"Unsupported checkpoint format: {checkpoint_format}. "
+                f"Choose from {CHECKPOINT_FORMATS}"
+            )
+        if checkpoint_format == "safetensors" and not HAS_SAFETENSORS:
+            raise ImportError(
+                "checkpoint_format='safetensors' requires the safetensors package"
+            )
+        if compress and checkpoint_format != "torch":
+            raise ValueError(
+                "compress is only supported with checkpoint_format='torch'"
+            )
+        if compress and not HAS_ZSTD:
+            raise ImportError("compress=True requires the zstandard package")
+        if optimizer_dtype is not None and optimizer_dtype not in _OPTIMIZER_DTYPES:
+            raise ValueError(
+                f"Unsupported optimizer_dtype: {optimizer_dtype}. "
+                f"Choose from {_OPTIMIZER_DTYPES}"
+            )
+
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
 
@@ -32,9 +425,44 @@ class CheckpointManager:
         self.minimize_metric = minimize_metric
         self.save_optimizer = save_optimizer
         self.save_scheduler = save_scheduler
+        self.async_save = async_save
+        self.use_pinned = use_pinned
+        self.use_dcp = use_dcp
+        self.delta_checkpoints = delta_checkpoints
+        self.full_every_n = max(full_every_n, 1)
+        self.checkpoint_format = checkpoint_format
+        self.prefetch_auto = prefetch_auto
+        self.optimizer_dtype = optimizer_dtype
+        self.compress = compress
+        self.compression_level = compression_level
+
+        # Background writer; a single worker keeps saves in submission order
+        self._save_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="checkpoint-save"
+        )
+        self._pending_saves: dict[str, Future[None]] = {}
+        self._pending_tasks: list[Future[None]] = []
+        self._pinned_cache: dict[str, torch.Tensor] = {}
+
+        # Device-to-host staging copies run here, off the training stream
+        self._ckpt_stream = torch.cuda.Stream() if torch.cuda.is_available() else None
 
-        # Track checkpoints
-        self.checkpoint_history: list[dict[str, Any]] = []
+        # Held while history is rewritten by cleanup and while it is read
+        self._history_lock = threading.Lock()
+
+        # Delta mode: digest and owning checkpoint file of every model tensor
+        self._tensor_sources: dict[str, tuple[bytes, str]] = {}
+        self._num_delta_saves = 0
+
+        # Track checkpoints; history is bounded, older entries stay in the JSONL
+        self._history_maxlen = (
+            max(max_checkpoints * 4, 32) if max_checkpoints > 0 else None
+        )
+        self.checkpoint_history: deque[dict[str, Any]] = deque(
+            maxlen=self._history_maxlen
+        )
+        self._history_lines = 0
+        self._saved_meta: dict[str, Any] | None = None
         self.best_metric = float("inf") if minimize_metric else float("-inf")
         self.best_checkpoint_path: str | None = None
 
@@ -42,6 +470,7 @@ class CheckpointManager:
         self.logger = logging.getLogger(__name__)
 
         # Load existing checkpoint history
+        self._remove_partial_checkpoints()
         self._load_checkpoint_history()
 
     def save_checkpoint(
@@ -54,11 +483,47 @@ class CheckpointManager:
         scheduler: Any | None = None,
         extra_data: dict[str, Any] | None = None,
     ) -> str:
-        """Save a model checkpoint."""
+        """Save a model checkpoint.
+
+        By default the checkpoint is written, recorded in the history and old
+        checkpoints are cleaned up before this returns. With ``async_save``,
+        tensors are snapshotted into reusable host buffers and all of that runs
+        in the background instead, so training may continue meanwhile: the
+        returned path may not exist yet, the history and best checkpoint update
+        later, and write errors are raised by the next :meth:`flush` or save.
+        Call :meth:`flush` before reading the checkpoint.
+
+        With ``use_dcp`` under an initialized process group, every rank must
+        call this method: each writes its local shards through
+        ``torch.distributed.checkpoint`` into a ``step_{step}`` directory and
+        rank 0 manages the history. Rank 0 writes the trainer state last, once
+        all shards are in place, so it marks the directory as complete.
+
+        With ``delta_checkpoints``, only model tensors that changed since the
+        previous save are written; the rest are referenced from the checkpoint
+        file that holds them, and every ``full_every_n``-th save is full.
+
+        ``checkpoint_format="per_tensor"`` writes a directory with one raw file
+        per tensor, written concurrently, plus a ``meta.json`` index holding the
+        remaining state. ``checkpoint_format="safetensors"`` writes a single
+        ``.safetensors`` file whose header carries the non-tensor state, so it
+        loads without unpickling and only the tensors that are read are paged in.
+
+        ``optimizer_dtype`` (bfloat16, float16 or int8) stores optimizer moments
+        in reduced precision. This is lossy; :meth:`resume_training` restores
+        FP32 moments.
+
+        ``compress`` zstd-compresses ``.pt`` checkpoints at
+        ``compression_level`` using all cores, trading CPU time in the
+        background writer for fewer bytes on slow storage.
+        """
+
+        # Staging buffers are reused, so the previous write must finish first
+        self.flush()
+        distributed = self._use_distributed_checkpoint()
 
         # Create checkpoint data
-        checkpoint_data = {
-            "model_state_dict": model.state_dict(),
+        checkpoint_data: dict[str, Any] = {
             "step": step,
             "epoch": epoch,
             "metrics": metrics,
@@ -66,24 +531,57 @@ class CheckpointManager:
             "extra_data": extra_data or {},
         }
 
-        # Add optimizer state
-        if optimizer is not None and self.save_optimizer:
-            checkpoint_data["optimizer_state_dict"] = optimizer.state_dict()
-
         # Add scheduler state
         if scheduler is not None and self.save_scheduler:
             if hasattr(scheduler, "state_dict"):
                 checkpoint_data["scheduler_state_dict"] = scheduler.state_dict()
 
-        # Generate checkpoint filename
-        checkpoint_name = f"checkpoint_step_{step}_epoch_{epoch}.pt"
-        checkpoint_path = self.checkpoint_dir / checkpoint_name
+        tensor_sources: dict[str, tuple[bytes, str]] | None = None
+        if distributed:
+            # Every rank writes its own shards into a per-step directory
+            checkpoint_path = self.checkpoint_dir / f"step_{step}"
+            write = self._save_distributed_checkpoint(
+                model, optimizer, checkpoint_data, checkpoint_path
+            )
+            if dist.get_rank() != 0:
+                return str(checkpoint_path)
+        else:
+            checkpoint_data["model_state_dict"] = model.state_dict()
+
+            # Add optimizer state
+            if optimizer is not None and self.save_optimizer:
+                optimizer_state = optimizer.state_dict()
+                if self.optimizer_dtype is not None:
+                    # Cast before staging so less data crosses to the host
+                    optimizer_state = _compress_optimizer_state(
+                        optimizer_state, self.optimizer_dtype
+                    )
+                checkpoint_data["optimizer_state_dict"] = optimizer_state
 
-        # Save checkpoint
-        torch.save(checkpoint_data, checkpoint_path)
-        self.logger.info(f"Saved checkpoint: {checkpoint_path}")
+            # Generate checkpoint filename
+            checkpoint_name = (
+                f"checkpoint_step_{step}_epoch_{epoch}"
+                f"{_FORMAT_SUFFIXES[self.checkpoint_format]}"
+            )
+            checkpoint_path = self.checkpoint_dir / checkpoint_name
+
+            # Snapshot tensors when the write is deferred (later optimizer steps
+            # must not change it) or delta digests need host copies
+            staged_data, staged_event = checkpoint_data, None
+            if self.async_save or self.delta_checkpoints:
+                staged_data, staged_event = self._stage_on_checkpoint_stream(
+                    checkpoint_data
+                )
+
+            if self.delta_checkpoints:
+                # Digests read the host copies, so they must have landed
+                if staged_event is not None:
+                    staged_event.synchronize()
+                depends_on, tensor_sources = self._drop_unchanged_tensors(
+                    staged_data, str(checkpoint_path)
+                )
 
-        # Update checkpoint history
+        # History entry; recorded once the checkpoint is in place
         checkpoint_info = {
             "path": str(checkpoint_path),
             "step": step,
@@ -91,41 +589,645 @@ class CheckpointManager:
             "metrics": metrics,
             "timestamp": checkpoint_data["timestamp"],
         }
-        self.checkpoint_history.append(checkpoint_info)
+        if not distributed and self.delta_checkpoints:
+            checkpoint_info["depends_on"] = depends_on
+
+        # Save checkpoint
+        if not distributed:
+            write = None
+            if self.async_save:
+                write = self._save_executor.submit(
+                    self._write_checkpoint, staged_data, checkpoint_path, staged_event
+                )
+                self._pending_saves[str(checkpoint_path)] = write
+            else:
+                self._write_checkpoint(staged_data, checkpoint_path, staged_event)
+
+        # Record history and clean up old checkpoints; queued behind the write
+        if self.async_save:
+            self._pending_tasks.append(
+                self._save_executor.submit(
+                    self._cleanup_and_persist_history,
+                    checkpoint_info,
+                    write,
+                    tensor_sources,
+                )
+            )
+        else:
+            self._cleanup_and_persist_history(checkpoint_info, None, tensor_sources)
+
+        return str(checkpoint_path)
+
+    def wait_for_saves(self) -> None:
+        """Block until all pending background checkpoint writes have finished."""
+        pending, self._pending_saves = self._pending_saves, {}
+        for future in pending.values():
+            future.result()
+
+    def flush(self) -> None:
+        """Block until background writes, cleanup and history updates finish."""
+        self.wait_for_saves()
+        tasks, self._pending_tasks = self._pending_tasks, []
+        for future in tasks:
+            future.result()
+
+    def _cleanup_and_persist_history(
+        self,
+        checkpoint_info: dict[str, Any],
+        write: Future[None] | None = None,
+        tensor_sources: dict[str, tuple[bytes, str]] | None = None,
+    ) -> None:
+        """Record ``checkpoint_info``, remove old checkpoints and persist history.
+
+        Best-checkpoint tracking and the delta ``tensor_sources`` are updated
+        here too. Nothing is recorded if the checkpoint's ``write`` failed; the
+        error is raised by :meth:`flush`.
+        """
+        if write is not None and write.exception() is not None:
+            return
+        if tensor_sources is not None:
+            self._tensor_sources = tensor_sources
+            self._num_delta_saves += 1
+        with self._history_lock:
+            self._update_best_checkpoint(checkpoint_info)
+            self.checkpoint_history.append(checkpoint_info)
+            self._cleanup_checkpoints()
+            self._save_checkpoint_history(checkpoint_info)
+
+    def _update_best_checkpoint(self, checkpoint_info: dict[str, Any]) -> None:
+        """Point the best-checkpoint slot at ``checkpoint_info`` if it improves."""
+        metrics = checkpoint_info["metrics"]
+        if not self.save_best or self.metric_for_best not in metrics:
+            return
+        current_metric = metrics[self.metric_for_best]
+        is_best = (self.minimize_metric and current_metric < self.best_metric) or (
+            not self.minimize_metric and current_metric > self.best_metric
+        )
+        if not is_best:
+            return
+
+        checkpoint_path = Path(checkpoint_info["path"])
+        self.best_metric = current_metric
+        self.best_checkpoint_path = str(checkpoint_path)
+
+        # Point the best slot at the checkpoint instead of copying it
+        best_link = self._link_best_checkpoint(checkpoint_path)
+        self.logger.info(
+            f"New best checkpoint: {best_link} -> {checkpoint_path.name} "
+            f"(metric: {current_metric:.4f})"
+        )
+
+    def _use_distributed_checkpoint(self) -> bool:
+        """Check whether saves should go through torch.distributed.checkpoint."""
+        return (
+            HAS_DCP and self.use_dcp and dist.is_available() and dist.is_initialized()
+        )
+
+    def _save_distributed_checkpoint(
+        self,
+        model: torch.nn.Module,
+        optimizer: torch.optim.Optimizer | None,
+        checkpoint_data: dict[str, Any],
+        checkpoint_path: Path,
+    ) -> Future[None] | None:
+        """Write each rank's local model/optimizer shards without a full gather.
+
+        Returns the pending write when it runs in the background. DCP's async
+        save runs its collectives on CPU tensors, so it is only used when the
+        default process group has a CPU backend; otherwise the save blocks.
+        Directories without trainer state are removed on startup.
+        """
+        options = StateDictOptions(full_state_dict=False)
+        state_dict: dict[str, Any] = {
+            "model": get_model_state_dict(model, options=options)
+        }
+        if optimizer is not None and self.save_optimizer:
+            state_dict["optimizer"] = get_optimizer_state_dict(
+                model, optimizer, options=options
+            )
+        checkpoint_data["sharded_state_keys"] = list(state_dict)
+
+        # A re-save of the same step is incomplete until its shards land
+        is_coordinator = dist.get_rank() == 0
+        if is_coordinator:
+            (checkpoint_path / _TRAINER_STATE_FILE).unlink(missing_ok=True)
+
+        writer = dcp.FileSystemWriter(str(checkpoint_path))
+        if self.async_save and hasattr(dcp, "async_save") and _has_cpu_collectives():
+            write = dcp.async_save(state_dict, storage_writer=writer)
+            if is_coordinator:
+                write = self._save_executor.submit(
+                    self._commit_distributed_checkpoint,
+                    checkpoint_data,
+                    checkpoint_path,
+                    write,
+                )
+            self._pending_saves[str(checkpoint_path)] = write
+            return write  # type: ignore[return-value]
+
+        dcp.save(state_dict, storage_writer=writer, planner=dcp.DefaultSavePlanner())
+        if is_coordinator:
+            self._commit_distributed_checkpoint(checkpoint_data, checkpoint_path)
+        return None
+
+    def _commit_distributed_checkpoint(
+        self,
+        checkpoint_data: dict[str, Any],
+        checkpoint_path: Path,
+        shards: Future[None] | None = None,
+    ) -> None:
+        """Write the trainer state that marks a sharded checkpoint complete.
+
+        Remaining training state is small and identical on every rank, so only
+        rank 0 writes it, after ``shards`` have finished.
+        """
+        if shards is not None:
+            shards.result()
+        trainer_state = checkpoint_path / _TRAINER_STATE_FILE
+        tmp_path = trainer_state.with_name(trainer_state.name + _PARTIAL_SUFFIX)
+        try:
+            torch.save(checkpoint_data, tmp_path)
+            os.replace(tmp_path, trainer_state)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self.logger.info(f"Saved checkpoint: {checkpoint_path}")
+
+    def _load_distributed_checkpoint(
+        self,
+        checkpoint_path: Path,
+        checkpoint_data: dict[str, Any],
+        model: torch.nn.Module,
+        optimizer: torch.optim.Optimizer | None = None,
+        strict: bool = True,
+    ) -> None:
+        """Load sharded state written by :meth:`_save_distributed_checkpoint`."""
+        if not HAS_DCP:
+            raise ImportError(
+                "Loading sharded checkpoints requires torch.distributed.checkpoint"
+            )
+
+        options = StateDictOptions(full_state_dict=False, strict=strict)
+        state_dict: dict[str, Any] = {
+            "model": get_model_state_dict(model, options=options)
+        }
+        load_optimizer = optimizer is not None and "optimizer" in checkpoint_data.get(
+            "sharded_state_keys", []
+        )
+        if load_optimizer:
+            state_dict["optimizer"] = get_optimizer_state_dict(
+                model, optimizer, options=options
+            )
 
-        # Check if this is the best checkpoint
-        if self.save_best and self.metric_for_best in metrics:
-            current_metric = metrics[self.metric_for_best]
-            is_best = (self.minimize_metric and current_metric < self.best_metric) or (
-                not self.minimize_metric and current_metric > self.best_metric
+        dcp.load(state_dict, storage_reader=dcp.FileSystemReader(str(checkpoint_path)))
+        set_model_state_dict(model, state_dict["model"], options=options)
+        if load_optimizer:
+            set_optimizer_state_dict(
+                model, optimizer, state_dict["optimizer"], options=options
             )
 
-            if is_best:
-                self.best_metric = current_metric
-                self.best_checkpoint_path = str(checkpoint_path)
+    def _drop_unchanged_tensors(
+        self, checkpoint_data: dict[str, Any], checkpoint_path: str
+    ) -> tuple[list[str], dict[str, tuple[bytes, str]]]:
+        """Turn staged checkpoint data into a delta against earlier saves.
+
+        Unchanged model tensors are removed from ``checkpoint_data`` and listed in
+        its ``delta_manifest`` with the checkpoint file that holds them. Returns
+        the checkpoint files this delta depends on and the tensor sources to
+        record once it has been written.
+        """
+        state_dict = checkpoint_data["model_state_dict"]
+        tensors = {k: v for k, v in state_dict.items() if isinstance(v, torch.Tensor)}
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            digests = dict(
+                zip(tensors, pool.map(_tensor_digest, tensors.values()), strict=True)
+            )
 
-                # Save as best checkpoint
-                best_checkpoint_path = self.checkpoint_dir / "best_checkpoint.pt"
-                shutil.copy2(checkpoint_path, best_checkpoint_path)
-                self.logger.info(
-                    f"New best checkpoint: {best_checkpoint_path} (metric: {current_metric:.4f})"
+        # Anchor a full checkpoint periodically to bound reconstruction cost
+        manifest: dict[str, str] = {}
+        tensor_sources: dict[str, tuple[bytes, str]] = {}
+        if self._num_delta_saves % self.full_every_n != 0:
+            tensor_sources.update(self._tensor_sources)
+            for fqn, digest in digests.items():
+                source = tensor_sources.get(fqn)
+                if source is not None and source[0] == digest:
+                    manifest[fqn] = source[1]
+
+        for fqn, digest in digests.items():
+            if fqn in manifest:
+                del state_dict[fqn]
+            else:
+                tensor_sources[fqn] = (digest, checkpoint_path)
+
+        if manifest:
+            checkpoint_data["delta_manifest"] = manifest
+        return sorted(set(manifest.values())), tensor_sources
+
+    def _resolve_delta(
+        self, checkpoint_data: dict[str, Any], manifest: dict[str, str]
+    ) -> None:
+        """Fill in tensors a delta checkpoint references from their source files."""
+        by_source: dict[str, list[str]] = defaultdict(list)
+        for fqn, source in manifest.items():
+            by_source[source].append(fqn)
+
+        state_dict = checkpoint_data["model_state_dict"]
+        for source, fqns in by_source.items():
+            if Path(source).suffix == ".safetensors":
+                # Read just the referenced tensors from the source file
+                with safe_open(source, framework="pt", device="cpu") as f:
+                    source_state = {
+                        fqn: f.get_tensor(f"/model_state_dict/{fqn}") for fqn in fqns
+                    }
+            elif Path(source).is_dir():
+                source_state = self._read_checkpoint(Path(source))["model_state_dict"]
+            else:
+                # Memory-map so only the referenced tensors are paged in
+                source_state = _load_torch_file(Path(source), mmap=True)[
+                    "model_state_dict"
+                ]
+            for fqn in fqns:
+                state_dict[fqn] = source_state[fqn]
+
+    def _stage_for_save(self, obj: Any, key: str = "") -> Any:
+        """Copy every tensor in ``obj`` into a cached host buffer keyed by ``key``."""
+        if isinstance(obj, torch.Tensor):
+            buffer = self._pinned_cache.get(key)
+            if buffer is None or buffer.shape != obj.shape or buffer.dtype != obj.dtype:
+                buffer = torch.empty(
+                    obj.shape,
+                    dtype=obj.dtype,
+                    pin_memory=self.use_pinned and obj.is_cuda,
+                )
+                self._pinned_cache[key] = buffer
+            return buffer.copy_(obj.detach(), non_blocking=True)
+        if isinstance(obj, dict):
+            staged = type(obj)(
+                (k, self._stage_for_save(v, f"{key}/{k}")) for k, v in obj.items()
+            )
+            # Module state dicts carry version metadata used by load_state_dict
+            if hasattr(obj, "_metadata"):
+                staged._metadata = obj._metadata
+            return staged
+        if type(obj) in (list, tuple):
+            return type(obj)(
+                self._stage_for_save(v, f"{key}/{i}") for i, v in enumerate(obj)
+            )
+        return obj
+
+    def _stage_on_checkpoint_stream(
+        self, checkpoint_data: dict[str, Any]
+    ) -> tuple[dict[str, Any], torch.cuda.Event | None]:
+        """Stage ``checkpoint_data`` without blocking the host on the copies.
+
+        On CUDA the copies are queued on a dedicated stream; the returned event
+        marks their completion and must be synchronized before the host buffers
+        are read.
+        """
+        if self._ckpt_stream is None:
+            return self._stage_for_save(checkpoint_data), None
+
+        training_stream = torch.cuda.current_stream()
+        # Copy the state as of all work queued so far
+        self._ckpt_stream.wait_stream(training_stream)
+        with torch.cuda.stream(self._ckpt_stream):
+            staged_data = self._stage_for_save(checkpoint_data)
+        staged_event = self._ckpt_stream.record_event()
+        # Later in-place updates (and reuse of freed temporaries) wait on the
+        # device for the copies, not on the host
+        training_stream.wait_event(staged_event)
+        return staged_data, staged_event
+
+    def _write_checkpoint(
+        self,
+        checkpoint_data: dict[str, Any],
+        checkpoint_path: Path,
+        staged_event: torch.cuda.Event | None = None,
+    ) -> None:
+        """Serialize staged checkpoint data in the configured format.
+
+        Data is written under a temporary name and renamed into place, so a
+        crash mid-write never leaves a truncated checkpoint behind.
+        """
+        if staged_event is not None:
+            staged_event.synchronize()
+        tmp_path = checkpoint_path.with_name(checkpoint_path.name + _PARTIAL_SUFFIX)
+        try:
+            if self.checkpoint_format == "per_tensor":
+                self._write_tensor_directory(checkpoint_data, tmp_path)
+            elif self.checkpoint_format == "safetensors":
+                self._write_safetensors(checkpoint_data, tmp_path)
+            elif self.compress:
+                compressor = zstd.ZstdCompressor(
+                    level=self.compression_level, threads=-1
                 )
+                with open(tmp_path, "wb") as f, compressor.stream_writer(f) as w:
+                    torch.save(checkpoint_data, w)
+            else:
+                torch.save(checkpoint_data, tmp_path)
+
+            if checkpoint_path.is_dir():
+                # os.replace only overwrites empty directories
+                shutil.rmtree(checkpoint_path)
+            os.replace(tmp_path, checkpoint_path)
+        except BaseException:
+            if tmp_path.is_dir():
+                shutil.rmtree(tmp_path, ignore_errors=True)
+            else:
+                tmp_path.unlink(missing_ok=True)
+            raise
+        self.logger.info(f"Saved checkpoint: {checkpoint_path}")
+
+    @staticmethod
+    def _write_safetensors(
+        checkpoint_data: dict[str, Any], checkpoint_path: Path
+    ) -> None:
+        """Write tensors as safetensors with the remaining state in its header."""
+        tensors: dict[str, torch.Tensor] = {}
+        state = _encode_state(checkpoint_data, tensors)
+        save_file(
+            {key: tensor.cpu().contiguous() for key, tensor in tensors.items()},
+            str(checkpoint_path),
+            metadata={_SAFETENSORS_STATE_KEY: _json_dumps(state).decode()},
+        )
 
-        # Cleanup old checkpoints
-        self._cleanup_checkpoints()
+    @staticmethod
+    def _read_safetensors(checkpoint_path: Path) -> dict[str, Any]:
+        """Rebuild checkpoint data written by :meth:`_write_safetensors`."""
+        with safe_open(str(checkpoint_path), framework="pt", device="cpu") as f:
+            state = _json_loads(f.metadata()[_SAFETENSORS_STATE_KEY])
+            tensors = {key: f.get_tensor(key) for key in f.keys()}
 
-        # Save checkpoint history
-        self._save_checkpoint_history()
+        checkpoint_data: dict[str, Any] = _decode_state(state, tensors)
+        return checkpoint_data
 
-        return str(checkpoint_path)
+    def _write_tensor_directory(
+        self, checkpoint_data: dict[str, Any], checkpoint_path: Path
+    ) -> None:
+        """Write every tensor to its own file in parallel, then the index."""
+        tensors: dict[str, torch.Tensor] = {}
+        state = _encode_state(checkpoint_data, tensors)
+        files = {key: f"{index:06d}.bin" for index, key in enumerate(tensors)}
+
+        checkpoint_path.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            futures = [
+                pool.submit(_write_tensor_file, tensor, checkpoint_path / files[key])
+                for key, tensor in tensors.items()
+            ]
+            for future in futures:
+                future.result()
+
+        index = {
+            "step": checkpoint_data["step"],
+            "epoch": checkpoint_data["epoch"],
+            "tensors": {
+                key: {
+                    "file": files[key],
+                    "dtype": str(tensor.dtype).removeprefix("torch."),
+                    "shape": list(tensor.shape),
+                }
+                for key, tensor in tensors.items()
+            },
+            "state": state,
+        }
+        (checkpoint_path / _TENSOR_INDEX_FILE).write_bytes(_json_dumps(index))
+
+    @staticmethod
+    def _read_tensor_index(checkpoint_path: Path) -> dict[str, Any]:
+        """Read the index of a per-tensor checkpoint directory."""
+        index: dict[str, Any] = _json_loads(
+            (checkpoint_path / _TENSOR_INDEX_FILE).read_bytes()
+        )
+        return index
+
+    @staticmethod
+    def _read_tensor_files(
+        checkpoint_path: Path, entries: dict[str, dict[str, Any]]
+    ) -> dict[str, torch.Tensor]:
+        """Load the given per-tensor files concurrently onto the CPU."""
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            futures = {
+                key: pool.submit(
+                    _read_tensor_file,
+                    checkpoint_path / entry["file"],
+                    entry["dtype"],
+                    entry["shape"],
+                )
+                for key, entry in entries.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
+
+    def _read_tensor_directory(self, checkpoint_path: Path) -> dict[str, Any]:
+        """Rebuild checkpoint data written by :meth:`_write_tensor_directory`."""
+        index = self._read_tensor_index(checkpoint_path)
+        tensors = self._read_tensor_files(checkpoint_path, index["tensors"])
+
+        checkpoint_data: dict[str, Any] = _decode_state(index["state"], tensors)
+        return checkpoint_data
+
+    def _pipelined_load_model(
+        self,
+        checkpoint_path: Path,
+        index: dict[str, Any],
+        model: torch.nn.Module,
+        strict: bool = True,
+        num_stagers: int = 2,
+    ) -> dict[str, Any]:
+        """Stream model tensors from disk to their (CUDA) parameters.
+
+        A reader thread loads raw files, ``num_stagers`` threads move them into
+        pinned memory and the calling thread issues non-blocking copies on a
+        dedicated CUDA stream, so disk, pinning and H2D transfers overlap.
+        Returns the remaining checkpoint data without ``model_state_dict``.
+        """
+        state = dict(index["state"])
+        sources = {
+            fqn: ref["__tensor__"]
+            for fqn, ref in state.pop("model_state_dict").items()
+            if isinstance(ref, dict) and "__tensor__" in ref
+        }
+        targets = model.state_dict(keep_vars=True)
+        entries = index["tensors"]
+        self._check_load_targets(
+            targets,
+            {fqn: entries[key]["shape"] for fqn, key in sources.items()},
+            strict,
+        )
+
+        def read(fqn: str) -> tuple[str, np.ndarray]:
+            path = checkpoint_path / entries[sources[fqn]]["file"]
+            return fqn, np.fromfile(path, dtype=np.uint8)
+
+        def stage(item: tuple[str, np.ndarray]) -> tuple[str, torch.Tensor]:
+            fqn, raw = item
+            entry = entries[sources[fqn]]
+            tensor = torch.from_numpy(raw).view(getattr(torch, entry["dtype"]))
+            return fqn, tensor.reshape(entry["shape"]).pin_memory()
+
+        work: queue.Queue[Any] = queue.Queue()
+        for fqn in sources:
+            if fqn in targets:
+                work.put(fqn)
+        work.put(None)
+        raw_queue: queue.Queue[Any] = queue.Queue(maxsize=4)
+        pinned_queue: queue.Queue[Any] = queue.Queue(maxsize=4)
+        stop = threading.Event()
+
+        workers = [
+            threading.Thread(
+                target=_pipeline_stage,
+                args=(read, work, raw_queue, stop, num_stagers),
+                daemon=True,
+            )
+        ] + [
+            threading.Thread(
+                target=_pipeline_stage,
+                args=(stage, raw_queue, pinned_queue, stop),
+                daemon=True,
+            )
+            for _ in range(num_stagers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        error: Exception | None = None
+        stream = torch.cuda.Stream()
+        # Parameters may still be written by kernels queued on the default stream
+        stream.wait_stream(torch.cuda.current_stream())
+        finished = 0
+        with torch.no_grad(), torch.cuda.stream(stream):
+            while finished < num_stagers:
+                item = pinned_queue.get()
+                if item is None:
+                    finished += 1
+                elif isinstance(item, Exception):
+                    error = error or item
+                elif error is None:
+                    fqn, tensor = item
+                    try:
+                        targets[fqn].copy_(tensor, non_blocking=True)
+                    except Exception as e:
+                        error = e
+                        stop.set()
+        stream.synchronize()
+
+        for worker in workers:
+            worker.join()
+        if error is not None:
+            raise error
+
+        other_entries = {
+            key: entry
+            for key, entry in entries.items()
+            if not key.startswith("/model_state_dict/")
+        }
+        tensors = self._read_tensor_files(checkpoint_path, other_entries)
+        checkpoint_data: dict[str, Any] = _decode_state(state, tensors)
+        return checkpoint_data
+
+    @staticmethod
+    def _check_load_targets(
+        targets: dict[str, torch.Tensor], shapes: dict[str, list[int]], strict: bool
+    ) -> None:
+        """Apply ``load_state_dict``'s key and shape checks to a direct load."""
+        missing = sorted(set(targets) - set(shapes))
+        unexpected = sorted(set(shapes) - set(targets))
+        if strict and (missing or unexpected):
+            raise RuntimeError(
+                f"Error(s) in loading state_dict: missing keys {missing}, "
+                f"unexpected keys {unexpected}"
+            )
+        for fqn in set(shapes) & set(targets):
+            if list(targets[fqn].shape) != list(shapes[fqn]):
+                raise RuntimeError(
+                    f"Size mismatch for {fqn}: checkpoint has "
+                    f"{list(shapes[fqn])}, model has {list(targets[fqn].shape)}"
+                )
+
+    def _best_checkpoint_slots(self) -> list[Path]:
+        """Best-checkpoint link names, one per checkpoint file suffix."""
+        return [
+            self.checkpoint_dir / f"best_checkpoint{suffix}"
+            for suffix in _FORMAT_SUFFIXES.values()
+        ]
+
+    def _link_best_checkpoint(self, checkpoint_path: Path) -> Path:
+        """Point the best-checkpoint slot at ``checkpoint_path`` in O(1)."""
+        pointer = self.checkpoint_dir / _BEST_POINTER_FILE
+        for slot in [*self._best_checkpoint_slots(), pointer]:
+            if slot.is_symlink() or slot.is_file():
+                slot.unlink()
+            elif slot.is_dir():
+                # Full copy left by an older version of this manager
+                shutil.rmtree(slot)
+
+        # The target may still be being written; the link is relative so the
+        # checkpoint directory can be moved as a whole
+        is_dir = not checkpoint_path.suffix
+        best_link = self.checkpoint_dir / f"best_checkpoint{checkpoint_path.suffix}"
+        try:
+            best_link.symlink_to(checkpoint_path.name, target_is_directory=is_dir)
+        except (OSError, NotImplementedError):
+            # e.g. Windows without symlink privileges
+            pointer.write_text(checkpoint_path.name)
+            return pointer
+        return best_link
+
+    def _best_link_target(self) -> Path | None:
+        """Resolve the best-checkpoint link or pointer file, if any."""
+        pointer = self.checkpoint_dir / _BEST_POINTER_FILE
+        if pointer.is_file():
+            return self.checkpoint_dir / Path(pointer.read_text().strip()).name
+        for slot in self._best_checkpoint_slots():
+            if slot.is_symlink():
+                return self.checkpoint_dir / Path(os.readlink(slot)).name
+        return None
+
+    def _existing_paths(self) -> set[str]:
+        """Names of entries in the checkpoint directory, from a single scan.
+
+        Checkpoints still being written in the background are included.
+        """
+        with os.scandir(self.checkpoint_dir) as entries:
+            names = {entry.name for entry in entries}
+        names.update(Path(path).name for path in self._pending_saves)
+        return names
+
+    def _checkpoint_exists(self, checkpoint_path: str) -> bool:
+        """Check whether a checkpoint is on disk or still being written."""
+        return checkpoint_path in self._pending_saves or Path(checkpoint_path).exists()
 
     def load_checkpoint(
         self, checkpoint_path: str | None = None, load_best: bool = False
     ) -> dict[str, Any]:
         """Load a checkpoint."""
 
+        checkpoint_path_obj = self._resolve_checkpoint_path(checkpoint_path, load_best)
+
+        self.logger.info(f"Loading checkpoint: {checkpoint_path_obj}")
+        if self.prefetch_auto:
+            # Saturate storage bandwidth before the loader reads sequentially
+            if checkpoint_path_obj.is_dir():
+                paths = [p for p in checkpoint_path_obj.rglob("*") if p.is_file()]
+            else:
+                paths = [checkpoint_path_obj]
+            _prefetch_to_page_cache(paths)
+        checkpoint_data = self._read_checkpoint(checkpoint_path_obj)
+
+        return checkpoint_data
+
+    def _resolve_checkpoint_path(
+        self, checkpoint_path: str | None = None, load_best: bool = False
+    ) -> Path:
+        """Pick the checkpoint to load, waiting for it to finish writing."""
+        self.flush()
+
         if load_best:
-            checkpoint_path_obj = self.checkpoint_dir / "best_checkpoint.pt"
+            best_path = self.get_best_checkpoint()
+            if best_path is None:
+                raise FileNotFoundError("No best checkpoint found")
+            checkpoint_path_obj = Path(best_path)
         elif checkpoint_path is None:
             # Load latest checkpoint
             latest_path = self.get_latest_checkpoint()
@@ -138,9 +1240,28 @@ class CheckpointManager:
         if not checkpoint_path_obj.exists():
             raise FileNotFoundError(f"Checkpoint not found: {checkpoint_path_obj}")
 
-        self.logger.info(f"Loading checkpoint: {checkpoint_path_obj}")
-        checkpoint_data: dict[str, Any] = torch.load(checkpoint_path_obj, map_location="cpu")  # type: ignore[assignment]
+        return checkpoint_path_obj
+
+    def _read_checkpoint(self, checkpoint_path: Path) -> dict[str, Any]:
+        """Read checkpoint data from a file or a checkpoint directory."""
+        if (checkpoint_path / _TRAINER_STATE_FILE).is_file():
+            # Shards are loaded into the model later, in place, by dcp.load
+            checkpoint_data: dict[str, Any] = torch.load(
+                checkpoint_path / _TRAINER_STATE_FILE, map_location="cpu"
+            )
+            checkpoint_data["sharded_checkpoint_path"] = str(checkpoint_path)
+            return checkpoint_data
+
+        if checkpoint_path.is_dir():
+            checkpoint_data = self._read_tensor_directory(checkpoint_path)
+        elif checkpoint_path.suffix == ".safetensors":
+            checkpoint_data = self._read_safetensors(checkpoint_path)
+        else:
+            checkpoint_data = _load_torch_file(checkpoint_path)
 
+        manifest = checkpoint_data.pop("delta_manifest", None)
+        if manifest:
+            self._resolve_delta(checkpoint_data, manifest)
         return checkpoint_data
 
     def load_model_from_checkpoint(
@@ -150,12 +1271,37 @@ class CheckpointManager:
         load_best: bool = False,
         strict: bool = True,
     ) -> dict[str, Any]:
-        """Load model state from checkpoint."""
+        """Load model state from checkpoint.
+
+        Per-tensor checkpoints loaded into a CUDA model are streamed straight
+        into the parameters through a read/pin/copy pipeline; the returned data
+        then omits ``model_state_dict``.
+        """
+
+        checkpoint_path_obj = self._resolve_checkpoint_path(checkpoint_path, load_best)
+        if (checkpoint_path_obj / _TENSOR_INDEX_FILE).is_file():
+            index = self._read_tensor_index(checkpoint_path_obj)
+            on_cuda = any(p.is_cuda for p in model.parameters())
+            if on_cuda and "delta_manifest" not in index["state"]:
+                self.logger.info(f"Streaming checkpoint: {checkpoint_path_obj}")
+                checkpoint_data = self._pipelined_load_model(
+                    checkpoint_path_obj, index, model, strict=strict
+                )
+                self.logger.info("Loaded model state from checkpoint")
+                return checkpoint_data
 
-        checkpoint_data = self.load_checkpoint(checkpoint_path, load_best)
+        checkpoint_data = self.load_checkpoint(str(checkpoint_path_obj))
 
         # Load model state
-        if "model_state_dict" in checkpoint_data:
+        if "sharded_checkpoint_path" in checkpoint_data:
+            self._load_distributed_checkpoint(
+                Path(checkpoint_data["sharded_checkpoint_path"]),
+                checkpoint_data,
+                model,
+                strict=strict,
+            )
+            self.logger.info("Loaded sharded model state from checkpoint")
+        elif "model_state_dict" in checkpoint_data:
             model.load_state_dict(checkpoint_data["model_state_dict"], strict=strict)
             self.logger.info("Loaded model state from checkpoint")
         else:
@@ -163,6 +1309,60 @@ class CheckpointManager:
 
         return checkpoint_data
 
+    def load_model_from_checkpoint_parallel(
+        self,
+        model: torch.nn.Module,
+        checkpoint_path: str | None = None,
+        load_best: bool = False,
+        strict: bool = True,
+        num_streams: int = 4,
+    ) -> dict[str, Any]:
+        """Load model state into a CUDA model with concurrent H2D copies.
+
+        Bypasses ``load_state_dict``: tensors are pinned by a thread pool and
+        copied into the parameters and buffers round-robin over
+        ``num_streams`` CUDA streams. CPU models and checkpoints without a
+        ``model_state_dict`` go through :meth:`load_model_from_checkpoint`.
+        """
+        on_cuda = any(p.is_cuda for p in model.parameters())
+        if not on_cuda:
+            return self.load_model_from_checkpoint(
+                model, checkpoint_path, load_best, strict
+            )
+
+        checkpoint_data = self.load_checkpoint(checkpoint_path, load_best)
+        state_dict = checkpoint_data.get("model_state_dict")
+        if state_dict is None:
+            return self.load_model_from_checkpoint(
+                model, checkpoint_path, load_best, strict
+            )
+
+        targets = model.state_dict(keep_vars=True)
+        self._check_load_targets(
+            targets, {fqn: list(t.shape) for fqn, t in state_dict.items()}, strict
+        )
+        fqns = [fqn for fqn in state_dict if fqn in targets]
+
+        def pin(fqn: str) -> torch.Tensor:
+            tensor = state_dict[fqn]
+            return tensor if tensor.is_pinned() else tensor.pin_memory()
+
+        streams = [torch.cuda.Stream() for _ in range(max(num_streams, 1))]
+        # Parameters may still be written by kernels queued on the default stream
+        for stream in streams:
+            stream.wait_stream(torch.cuda.current_stream())
+        with torch.no_grad(), ThreadPoolExecutor(max_workers=len(streams)) as pool:
+            for i, (fqn, tensor) in enumerate(
+                zip(fqns, pool.map(pin, fqns), strict=True)
+            ):
+                with torch.cuda.stream(streams[i % len(streams)]):
+                    targets[fqn].copy_(tensor, non_blocking=True)
+        for stream in streams:
+            stream.synchronize()
+
+        self.logger.info("Loaded model state from checkpoint")
+        return checkpoint_data
+
     def resume_training(
         self,
         model: torch.nn.Module,
@@ -174,6 +1374,16 @@ class CheckpointManager:
 
         checkpoint_data = self.load_checkpoint(checkpoint_path)
 
+        # Load sharded model and optimizer state in place
+        if "sharded_checkpoint_path" in checkpoint_data:
+            self._load_distributed_checkpoint(
+                Path(checkpoint_data["sharded_checkpoint_path"]),
+                checkpoint_data,
+                model,
+                optimizer,
+            )
+            self.logger.info("Resumed sharded model state from checkpoint")
+
         # Load model state
         if "model_state_dict" in checkpoint_data:
             model.load_state_dict(checkpoint_data["model_state_dict"])
@@ -181,7 +1391,10 @@ class CheckpointManager:
 
         # Load optimizer state
         if optimizer is not None and "optimizer_state_dict" in checkpoint_data:
-            optimizer.load_state_dict(checkpoint_data["optimizer_state_dict"])
+            # Moments saved with optimizer_dtype are restored to FP32 first
+            optimizer.load_state_dict(
+                _decompress_optimizer_state(checkpoint_data["optimizer_state_dict"])
+            )
             self.logger.info("Resumed optimizer state from checkpoint")
 
         # Load scheduler state
@@ -194,129 +1407,255 @@ class CheckpointManager:
 
     def get_latest_checkpoint(self) -> str | None:
         """Get path to the latest checkpoint."""
-        if not self.checkpoint_history:
-            return None
+        with self._history_lock:
+            if not self.checkpoint_history:
+                return None
 
-        # Sort by step (latest first)
-        sorted_checkpoints = sorted(
-            self.checkpoint_history, key=lambda x: x["step"], reverse=True
-        )
+            # Sort by step (latest first)
+            sorted_checkpoints = sorted(
+                self.checkpoint_history, key=lambda x: x["step"], reverse=True
+            )
 
         # Find first existing checkpoint
+        existing_names = self._existing_paths()
         for checkpoint_info in sorted_checkpoints:
-            if Path(checkpoint_info["path"]).exists():
+            if Path(checkpoint_info["path"]).name in existing_names:
                 return checkpoint_info["path"]  # type: ignore[no-any-return]
 
         return None
 
     def get_best_checkpoint(self) -> str | None:
         """Get path to the best checkpoint."""
-        best_path = self.checkpoint_dir / "best_checkpoint.pt"
-        if best_path.exists():
-            return str(best_path)
+        target = self._best_link_target()
+        if target is not None and self._checkpoint_exists(str(target)):
+            return str(target)
+
+        # Standalone copies written by older versions
+        for best_path in self._best_checkpoint_slots():
+            if best_path.exists() and not best_path.is_symlink():
+                return str(best_path)
         return self.best_checkpoint_path
 
     def list_checkpoints(self) -> list[dict[str, Any]]:
         """List all available checkpoints."""
         available_checkpoints = []
-        for checkpoint_info in self.checkpoint_history:
-            if Path(checkpoint_info["path"]).exists():
-                available_checkpoints.append(checkpoint_info)
+        with self._history_lock:
+            existing_names = self._existing_paths()
+            for checkpoint_info in self.checkpoint_history:
+                if Path(checkpoint_info["path"]).name in existing_names:
+                    available_checkpoints.append(checkpoint_info)
 
         return sorted(available_checkpoints, key=lambda x: x["step"], reverse=True)
 
     def delete_checkpoint(self, checkpoint_path: str) -> None:
         """Delete a specific checkpoint."""
+        self.flush()
         checkpoint_path_obj = Path(checkpoint_path)
         if checkpoint_path_obj.exists():
-            checkpoint_path_obj.unlink()
+            self._remove_checkpoint_path(checkpoint_path_obj)
             self.logger.info(f"Deleted checkpoint: {checkpoint_path_obj}")
 
-            # Remove from history
-            self.checkpoint_history = [
-                info
-                for info in self.checkpoint_history
-                if info["path"] != str(checkpoint_path_obj)
-            ]
-            self._save_checkpoint_history()
+            # Later deltas must not reference tensors from the deleted file
+            self._tensor_sources = {
+                fqn: source
+                for fqn, source in self._tensor_sources.items()
+                if source[1] != str(checkpoint_path_obj)
+            }
+
+            # Remove from history; the JSONL entry is dropped on the next load
+            with self._history_lock:
+                self.checkpoint_history = deque(
+                    (
+                        info
+                        for info in self.checkpoint_history
+                        if info["path"] != str(checkpoint_path_obj)
+                    ),
+                    maxlen=self._history_maxlen,
+                )
+
+    @staticmethod
+    def _remove_checkpoint_path(checkpoint_path: Path) -> None:
+        """Delete a checkpoint file or sharded checkpoint directory."""
+        if checkpoint_path.is_dir():
+            shutil.rmtree(checkpoint_path)
+        else:
+            checkpoint_path.unlink()
 
     def _cleanup_checkpoints(self) -> None:
         """Remove old checkpoints based on max_checkpoints setting."""
         if self.max_checkpoints <= 0:
             return
 
-        # Get existing checkpoints sorted by step
-        existing_checkpoints = []
-        for checkpoint_info in self.checkpoint_history:
-            if Path(checkpoint_info["path"]).exists():
-                existing_checkpoints.append(checkpoint_info)
+        # One pass over the history: keep entries still on disk, in save order
+        existing_names = self._existing_paths()
+        live_checkpoints = [
+            info
+            for info in self.checkpoint_history
+            if Path(info["path"]).name in existing_names
+        ]
+        existing_checkpoints = sorted(
+            live_checkpoints, key=lambda x: x["step"], reverse=True
+        )
 
-        existing_checkpoints.sort(key=lambda x: x["step"], reverse=True)
+        # Don't delete the best checkpoint or files that surviving deltas read from
+        protected = {self.best_checkpoint_path}
+        best_target = self._best_link_target()
+        if best_target is not None:
+            protected.add(str(best_target))
+        for index, checkpoint_info in enumerate(existing_checkpoints):
+            if (
+                index < self.max_checkpoints
+                or checkpoint_info["path"] == self.best_checkpoint_path
+            ):
+                protected.update(checkpoint_info.get("depends_on", []))
 
         # Remove old checkpoints
+        removed: set[str] = set()
         checkpoints_to_remove = existing_checkpoints[self.max_checkpoints :]
         for checkpoint_info in checkpoints_to_remove:
             checkpoint_path = Path(checkpoint_info["path"])
 
-            # Don't delete the best checkpoint
-            if str(checkpoint_path) != self.best_checkpoint_path:
+            if str(checkpoint_path) not in protected:
+                # Never unlink a file that is still being written
+                pending = self._pending_saves.pop(str(checkpoint_path), None)
+                if pending is not None:
+                    pending.result()
                 try:
-                    checkpoint_path.unlink()
+                    self._remove_checkpoint_path(checkpoint_path)
+                    removed.add(checkpoint_info["path"])
                     self.logger.info(f"Cleaned up old checkpoint: {checkpoint_path}")
                 except Exception as e:
                     self.logger.warning(
                         f"Failed to delete checkpoint {checkpoint_path}: {e}"
                     )
 
-        # Update history to only include existing checkpoints
-        self.checkpoint_history = [
-            info for info in self.checkpoint_history if Path(info["path"]).exists()
-        ]
+        # History keeps the surviving checkpoints, without another disk scan
+        self.checkpoint_history = deque(
+            (info for info in live_checkpoints if info["path"] not in removed),
+            maxlen=self._history_maxlen,
+        )
+
+        # Compact the append-only history once it is mostly stale entries
+        if self._history_lines > 10 * (self._history_maxlen or 32):
+            self._compact_checkpoint_history()
+
+    def _save_checkpoint_history(
+        self, checkpoint_info: dict[str, Any] | None = None
+    ) -> None:
+        """Append a checkpoint to the history file and record best-checkpoint info.
+
+        The history is an append-only JSONL file, so each save writes one
+        line; the best-checkpoint record is only rewritten when it changes.
+        """
+        if checkpoint_info is not None:
+            with open(self.checkpoint_dir / _HISTORY_FILE, "ab") as f:
+                f.write(_json_dumps(checkpoint_info) + b"\n")
+            self._history_lines += 1
 
-    def _save_checkpoint_history(self) -> None:
-        """Save checkpoint history to disk."""
-        history_path = self.checkpoint_dir / "checkpoint_history.json"
-        history_data = {
-            "checkpoint_history": self.checkpoint_history,
+        meta = {
             "best_metric": self.best_metric,
             "best_checkpoint_path": self.best_checkpoint_path,
             "metric_for_best": self.metric_for_best,
             "minimize_metric": self.minimize_metric,
         }
-
-        with open(history_path, "w") as f:
-            json.dump(history_data, f, indent=2)
+        if meta != self._saved_meta:
+            (self.checkpoint_dir / _HISTORY_META_FILE).write_bytes(_json_dumps(meta))
+            self._saved_meta = meta
+
+    def _compact_checkpoint_history(self) -> None:
+        """Rewrite the history file with only the tracked entries."""
+        history_path = self.checkpoint_dir / _HISTORY_FILE
+        tmp_path = history_path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "wb") as f:
+            f.writelines(_json_dumps(info) + b"\n" for info in self.checkpoint_history)
+        os.replace(tmp_path, history_path)
+        self._history_lines = len(self.checkpoint_history)
+
+    def _remove_partial_checkpoints(self) -> None:
+        """Delete checkpoints a crashed run left half-written."""
+        with os.scandir(self.checkpoint_dir) as entries:
+            partial = [
+                Path(entry.path)
+                for entry in entries
+                if (
+                    entry.name.startswith("checkpoint_")
+                    and entry.name.endswith(_PARTIAL_SUFFIX)
+                )
+                or (
+                    # Sharded saves that never wrote their trainer state
+                    entry.name.startswith("step_")
+                    and entry.is_dir()
+                    and not os.path.exists(
+                        os.path.join(entry.path, _TRAINER_STATE_FILE)
+                    )
+                )
+            ]
+        for path in partial:
+            try:
+                self._remove_checkpoint_path(path)
+                self.logger.info(f"Removed partial checkpoint: {path}")
+            except OSError as e:
+                self.logger.warning(f"Failed to remove partial checkpoint {path}: {e}")
 
     def _load_checkpoint_history(self) -> None:
         """Load checkpoint history from disk."""
-        history_path = self.checkpoint_dir / "checkpoint_history.json"
+        history_path = self.checkpoint_dir / _HISTORY_FILE
+        legacy_path = self.checkpoint_dir / _LEGACY_HISTORY_FILE
+        meta_path = self.checkpoint_dir / _HISTORY_META_FILE
 
-        if history_path.exists():
-            try:
-                with open(history_path) as f:
-                    history_data = json.load(f)
+        if not history_path.exists() and not legacy_path.exists():
+            return
 
-                self.checkpoint_history = history_data.get("checkpoint_history", [])
-                self.best_metric = history_data.get(
-                    "best_metric",
-                    float("inf") if self.minimize_metric else float("-inf"),
-                )
-                self.best_checkpoint_path = history_data.get("best_checkpoint_path")
+        try:
+            if history_path.exists():
+                entries = []
+                with open(history_path, "rb") as f:
+                    for line in f:
+                        try:
+                            entries.append(_decode_state(_json_loads(line)))
+                        except json.JSONDecodeError:
+                            # Torn last line from an interrupted append
+                            continue
+                self._history_lines = len(entries)
+                history_data = {}
+                if meta_path.exists():
+                    history_data = _decode_state(_json_loads(meta_path.read_bytes()))
+            else:
+                # Single JSON document written by older versions
+                history_data = _json_loads(legacy_path.read_bytes())
+                entries = history_data.get("checkpoint_history", [])
+
+            self.best_metric = history_data.get(
+                "best_metric",
+                float("inf") if self.minimize_metric else float("-inf"),
+            )
+            self.best_checkpoint_path = history_data.get("best_checkpoint_path")
 
-                # Filter out non-existent checkpoints
-                self.checkpoint_history = [
+            # Filter out non-existent checkpoints, keeping the newest entry per path
+            existing_names = self._existing_paths()
+            latest = {info["path"]: info for info in entries}
+            self.checkpoint_history = deque(
+                (
                     info
-                    for info in self.checkpoint_history
-                    if Path(info["path"]).exists()
-                ]
+                    for info in latest.values()
+                    if Path(info["path"]).name in existing_names
+                ),
+                maxlen=self._history_maxlen,
+            )
 
-                self.logger.info(
-                    f"Loaded checkpoint history with {len(self.checkpoint_history)} checkpoints"
-                )
+            if not history_path.exists():
+                # Migrate so later appends extend the old entries
+                self._compact_checkpoint_history()
+                self._save_checkpoint_history()
+                legacy_path.unlink()
 
-            except Exception as e:
-                self.logger.warning(f"Failed to load checkpoint history: {e}")
-                self.checkpoint_history = []
+            self.logger.info(
+                f"Loaded checkpoint history with {len(self.checkpoint_history)} checkpoints"
+            )
+
+        except Exception as e:
+            self.logger.warning(f"Failed to load checkpoint history: {e}")
+            self.checkpoint_history = deque(maxlen=self._history_maxlen)
 
     def export_model(
         self,
@@ -326,21 +1665,33 @@ class CheckpointManager:
         load_best: bool = False,
         export_format: str = "torch",
     ) -> None:
-        """Export model for deployment."""
+        """Export model for deployment.
 
-        # Load checkpoint if specified
-        if checkpoint_path or load_best:
-            self.load_model_from_checkpoint(model, checkpoint_path, load_best)
+        ``export_format="state_dict"`` re-emits the checkpoint's model state
+        directly, without loading it into ``model`` first.
+        """
 
         export_path_obj = Path(export_path)
         export_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
+        model_state = None
+        if checkpoint_path or load_best:
+            if export_format == "state_dict":
+                checkpoint_data = self.load_checkpoint(checkpoint_path, load_best)
+                model_state = checkpoint_data.get("model_state_dict")
+            if model_state is None:
+                # Sharded checkpoints and whole-model exports need the live model
+                self.load_model_from_checkpoint(model, checkpoint_path, load_best)
+
         if export_format == "torch":
             # Save complete model
             torch.save(model, export_path_obj)
         elif export_format == "state_dict":
             # Save only state dict
-            torch.save(model.state_dict(), export_path_obj)
+            torch.save(
+                model_state if model_state is not None else model.state_dict(),
+                export_path_obj,
+            )
         elif export_format == "onnx":
             try:
                 # Export to ONNX (requires example input)
@@ -366,22 +1717,54 @@ class CheckpointManager:
 
     def get_checkpoint_info(self, checkpoint_path: str) -> dict[str, Any]:
         """Get information about a checkpoint without loading the full model."""
+        self.flush()
         checkpoint_path_obj = Path(checkpoint_path)
 
         if not checkpoint_path_obj.exists():
             raise FileNotFoundError(f"Checkpoint not found: {checkpoint_path_obj}")
 
         # Load only metadata
-        checkpoint_data = torch.load(checkpoint_path_obj, map_location="cpu")
+        checkpoint_data = self._read_checkpoint_metadata(checkpoint_path_obj)
+        if checkpoint_path_obj.is_dir():
+            file_size = sum(
+                p.stat().st_size for p in checkpoint_path_obj.rglob("*") if p.is_file()
+            )
+        else:
+            file_size = checkpoint_path_obj.stat().st_size
 
         info = {
             "step": checkpoint_data.get("step"),
             "epoch": checkpoint_data.get("epoch"),
             "metrics": checkpoint_data.get("metrics", {}),
             "timestamp": checkpoint_data.get("timestamp"),
-            "file_size": checkpoint_path_obj.stat().st_size,
-            "has_optimizer": "optimizer_state_dict" in checkpoint_data,
+            "file_size": file_size,
+            "has_optimizer": "optimizer_state_dict" in checkpoint_data
+            or "optimizer" in checkpoint_data.get("sharded_state_keys", []),
             "has_scheduler": "scheduler_state_dict" in checkpoint_data,
         }
 
         return info
+
+    def _read_checkpoint_metadata(self, checkpoint_path: Path) -> dict[str, Any]:
+        """Read the non-tensor checkpoint fields without loading tensor data.
+
+        Tensors in the returned dict are omitted or replaced by placeholders.
+        """
+        if (checkpoint_path / _TENSOR_INDEX_FILE).is_file():
+            state = self._read_tensor_index(checkpoint_path)["state"]
+            metadata: dict[str, Any] = _decode_state(state)
+            return metadata
+        if checkpoint_path.is_dir():
+            # Sharded checkpoints keep their metadata in a small torch file
+            return self._read_checkpoint(checkpoint_path)
+
+        try:
+            if checkpoint_path.suffix == ".safetensors":
+                with safe_open(str(checkpoint_path), framework="pt", device="cpu") as f:
+                    state = _json_loads(f.metadata()[_SAFETENSORS_STATE_KEY])
+                metadata = _decode_state(state)
+                return metadata
+            return _read_torch_metadata(checkpoint_path)
+        except Exception as e:
+            self.logger.debug(f"Falling back to a full load of {checkpoint_path}: {e}")
+            return self._read_checkpoint(checkpoint_path)
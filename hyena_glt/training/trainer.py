@@ -247,6 +247,8 @@ class HyenaGLTTrainer:
             checkpoint_dir=os.path.join(config.output_dir, "checkpoints"),
             max_checkpoints=config.save_total_limit,
             save_best=not config.save_best_only,
+            # Writes overlap training; the final save is flushed in train()
+            async_save=True,
         )
 
         # Training state
@@ -473,8 +475,9 @@ class HyenaGLTTrainer:
             final_metrics = self.evaluate()
             self.logger.info(f"Final evaluation metrics: {final_metrics}")
 
-        # Save final checkpoint
+        # Save final checkpoint and wait for background writes and cleanup to land
         self._save_checkpoint()
+        self.checkpoint_manager.flush()
 
         self.logger.info("Training completed!")
 
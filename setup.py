@@ -96,6 +96,16 @@ setup(
             "ipywidgets>=7.6.0",
             "plotly>=5.0.0",
         ],
+        "fast": [
+            "rapidfuzz>=3.6.0",
+            "numba>=0.57.0",
+            "xxhash>=3.0.0",
+            "orjson>=3.8.0",
+        ],
+        "checkpoint": [
+            "safetensors>=0.4.0",
+            "zstandard>=0.19.0",
+        ],
     },
     entry_points={
         "console_scripts": [
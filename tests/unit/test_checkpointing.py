@@ -0,0 +1,666 @@
+"""
+Unit tests for the checkpoint manager.
+"""
+
+import json
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import torch
+import torch.distributed as dist
+import torch.nn as nn
+
+from hyena_glt.training.checkpointing import (
+    HAS_DCP,
+    HAS_SAFETENSORS,
+    HAS_ZSTD,
+    CheckpointManager,
+    _prefetch_to_page_cache,
+)
+
+
+def _make_model() -> nn.Module:
+    torch.manual_seed(0)
+    return nn.Sequential(nn.Linear(4, 8), nn.ReLU(), nn.Linear(8, 2))
+
+
+def _train_step(model: nn.Module, optimizer: torch.optim.Optimizer) -> None:
+    param = next(model.parameters())
+    loss = model(torch.randn(3, 4, dtype=param.dtype, device=param.device)).sum()
+    loss.backward()
+    optimizer.step()
+    optimizer.zero_grad()
+
+
+class TestAsyncSave:
+    """Test background checkpoint writes."""
+
+    def test_snapshot_is_isolated_from_later_updates(self, tmp_path):
+        """Test the saved state reflects the model at save time."""
+        model = _make_model()
+        optimizer = torch.optim.AdamW(model.parameters())
+        _train_step(model, optimizer)
+        manager = CheckpointManager(str(tmp_path), async_save=True)
+
+        expected = {k: v.clone() for k, v in model.state_dict().items()}
+        path = manager.save_checkpoint(model, step=1, epoch=0, metrics={"loss": 1.0})
+        _train_step(model, optimizer)
+        manager.wait_for_saves()
+
+        loaded = manager.load_checkpoint(path)
+        for name, tensor in expected.items():
+            assert torch.equal(loaded["model_state_dict"][name], tensor)
+
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA required")
+    def test_cuda_snapshot_on_checkpoint_stream(self, tmp_path):
+        """Test staged copies from the side stream capture pre-update values."""
+        model = _make_model().cuda()
+        optimizer = torch.optim.AdamW(model.parameters())
+        manager = CheckpointManager(str(tmp_path), async_save=True)
+
+        expected = {k: v.cpu() for k, v in model.state_dict().items()}
+        path = manager.save_checkpoint(model, step=1, epoch=0, metrics={})
+        _train_step(model, optimizer)
+
+        loaded = manager.load_checkpoint(path)
+        for name, tensor in expected.items():
+            assert torch.equal(loaded["model_state_dict"][name], tensor)
+
+    def test_pending_checkpoint_survives_cleanup(self, tmp_path):
+        """Test saves still being written count towards max_checkpoints."""
+        model = _make_model()
+        manager = CheckpointManager(str(tmp_path), max_checkpoints=2, async_save=True)
+
+        for step in range(4):
+            manager.save_checkpoint(model, step=step, epoch=0, metrics={})
+        manager.flush()
+
+        assert [info["step"] for info in manager.list_checkpoints()] == [3, 2]
+        assert manager.load_checkpoint()["step"] == 3
+
+    def test_cleanup_runs_off_the_training_thread(self, tmp_path):
+        """Test save returns before cleanup and history writes have run."""
+        manager = CheckpointManager(str(tmp_path), async_save=True)
+        release = threading.Event()
+        cleanup = manager._cleanup_checkpoints
+
+        def blocked_cleanup():
+            assert release.wait(timeout=10)
+            cleanup()
+
+        with patch.object(manager, "_cleanup_checkpoints", blocked_cleanup):
+            manager.save_checkpoint(_make_model(), step=1, epoch=0, metrics={})
+            assert not (tmp_path / "checkpoint_history.jsonl").exists()
+            release.set()
+            manager.flush()
+
+        assert (tmp_path / "checkpoint_history.jsonl").exists()
+        assert not manager._pending_tasks
+
+    def test_failed_write_is_not_recorded(self, tmp_path):
+        """Test a crashed write leaves no file, temp file or history entry."""
+        manager = CheckpointManager(str(tmp_path), async_save=True)
+
+        with patch("torch.save", side_effect=OSError("disk full")):
+            path = manager.save_checkpoint(_make_model(), step=1, epoch=0, metrics={})
+            with pytest.raises(OSError):
+                manager.flush()
+
+        assert not Path(path).exists()
+        assert not list(tmp_path.glob("*.tmp"))
+        assert not manager.checkpoint_history
+        assert not (tmp_path / "checkpoint_history.jsonl").exists()
+
+    @pytest.mark.parametrize("async_save", [True, False])
+    def test_failed_write_keeps_best_and_delta_sources(self, tmp_path, async_save):
+        """Test a crashed write neither becomes best nor a delta source."""
+        model = _make_model()
+        manager = CheckpointManager(
+            str(tmp_path), delta_checkpoints=True, async_save=async_save
+        )
+        good = manager.save_checkpoint(model, step=1, epoch=0, metrics={"loss": 1.0})
+        manager.flush()
+
+        with patch("torch.save", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                manager.save_checkpoint(model, step=2, epoch=0, metrics={"loss": 0.5})
+                manager.flush()
+
+        assert manager.best_metric == 1.0
+        assert manager.best_checkpoint_path == good
+        assert manager.get_best_checkpoint() == good
+        assert manager.load_checkpoint(manager.get_best_checkpoint())["step"] == 1
+
+        # The next delta references the checkpoint that was actually written
+        path = manager.save_checkpoint(model, step=3, epoch=0, metrics={})
+        manager.flush()
+        loaded = manager.load_checkpoint(path)["model_state_dict"]
+        for name, tensor in model.state_dict().items():
+            assert torch.equal(loaded[name], tensor)
+
+    def test_partial_files_removed_on_startup(self, tmp_path):
+        """Test leftovers of an interrupted write are deleted on reopen."""
+        (tmp_path / "checkpoint_step_9_epoch_0.pt.tmp").write_bytes(b"torn")
+
+        CheckpointManager(str(tmp_path))
+
+        assert not list(tmp_path.iterdir())
+
+    def test_synchronous_save(self, tmp_path):
+        """Test saves are synchronous by default and skip staging copies."""
+        manager = CheckpointManager(str(tmp_path))
+
+        path = manager.save_checkpoint(_make_model(), step=5, epoch=1, metrics={})
+
+        assert not manager._pending_saves
+        assert not manager._pinned_cache
+        assert manager.get_checkpoint_info(path)["step"] == 5
+
+
+class TestOptimizerStateCompression:
+    """Test reduced-precision storage of optimizer moments."""
+
+    @pytest.mark.parametrize("dtype", [torch.bfloat16, torch.int8])
+    def test_moments_compressed_and_restored(self, tmp_path, dtype):
+        """Test moments are stored narrow and resume as close FP32 values."""
+        model = _make_model()
+        optimizer = torch.optim.AdamW(model.parameters())
+        _train_step(model, optimizer)
+        manager = CheckpointManager(
+            str(tmp_path), optimizer_dtype=dtype, async_save=False
+        )
+
+        path = manager.save_checkpoint(
+            model, step=1, epoch=0, metrics={}, optimizer=optimizer
+        )
+        saved = torch.load(path, map_location="cpu")["optimizer_state_dict"]
+        assert saved["state"][0]["exp_avg"].dtype == dtype
+
+        restored_optimizer = torch.optim.AdamW(model.parameters())
+        manager.resume_training(model, restored_optimizer, checkpoint_path=path)
+
+        expected = optimizer.state_dict()["state"][0]["exp_avg"]
+        actual = restored_optimizer.state_dict()["state"][0]["exp_avg"]
+        assert actual.dtype == torch.float32
+        tolerance = expected.abs().max().item() / 100
+        torch.testing.assert_close(actual, expected, rtol=0.02, atol=tolerance)
+
+
+class TestBestCheckpointLink:
+    """Test best-checkpoint tracking without copying files."""
+
+    def test_best_is_symlink_to_checkpoint(self, tmp_path):
+        """Test the best slot links to the best save and survives cleanup."""
+        model = _make_model()
+        manager = CheckpointManager(str(tmp_path), max_checkpoints=1)
+
+        best = manager.save_checkpoint(model, step=1, epoch=0, metrics={"loss": 0.1})
+        manager.save_checkpoint(model, step=2, epoch=0, metrics={"loss": 0.5})
+        manager.save_checkpoint(model, step=3, epoch=0, metrics={"loss": 0.3})
+        manager.flush()
+
+        link = tmp_path / "best_checkpoint.pt"
+        assert link.is_symlink()
+        assert manager.get_best_checkpoint() == best
+        assert Path(best).exists()
+        assert manager.load_checkpoint(load_best=True)["step"] == 1
+
+
+class TestHistoryScans:
+    """Test history filtering against a single directory scan."""
+
+    def test_listing_does_not_stat_each_checkpoint(self, tmp_path):
+        """Test list/latest use the scanned name set instead of exists()."""
+        model = _make_model()
+        manager = CheckpointManager(str(tmp_path), async_save=False)
+        for step in range(3):
+            manager.save_checkpoint(model, step=step, epoch=0, metrics={})
+        Path(manager.checkpoint_history[0]["path"]).unlink()
+
+        with patch.object(Path, "exists", side_effect=AssertionError("stat")):
+            assert [info["step"] for info in manager.list_checkpoints()] == [2, 1]
+            assert manager.get_latest_checkpoint().endswith("step_2_epoch_0.pt")
+
+    def test_cleanup_scans_once(self, tmp_path):
+        """Test cleanup prunes files and history from one directory scan."""
+        model = _make_model()
+        manager = CheckpointManager(str(tmp_path), max_checkpoints=2, async_save=False)
+        for step in range(3):
+            manager.save_checkpoint(model, step=step, epoch=0, metrics={})
+
+        with patch.object(
+            manager, "_existing_paths", wraps=manager._existing_paths
+        ) as scan:
+            manager.save_checkpoint(model, step=3, epoch=0, metrics={})
+
+        assert scan.call_count == 1
+        assert [info["step"] for info in manager.checkpoint_history] == [2, 3]
+        assert sorted(p.name for p in tmp_path.glob("checkpoint_step_*")) == [
+            "checkpoint_step_2_epoch_0.pt",
+            "checkpoint_step_3_epoch_0.pt",
+        ]
+
+
+class TestCheckpointHistory:
+    """Test the append-only checkpoint history."""
+
+    def test_history_appends_and_reloads(self, tmp_path):
+        """Test each save appends one JSONL line that a new manager reloads."""
+        model = _make_model()
+        manager = CheckpointManager(str(tmp_path), async_save=False)
+        for step in range(3):
+            manager.save_checkpoint(model, step=step, epoch=0, metrics={"loss": 1.0})
+
+        lines = (tmp_path / "checkpoint_history.jsonl").read_text().splitlines()
+        assert len(lines) == 3
+
+        reloaded = CheckpointManager(str(tmp_path))
+        assert [info["step"] for info in reloaded.list_checkpoints()] == [2, 1, 0]
+        assert reloaded.best_checkpoint_path == manager.best_checkpoint_path
+        assert reloaded.best_metric == 1.0
+
+    def test_non_finite_values_round_trip(self, tmp_path):
+        """Test infinite metrics survive serialization of the history."""
+        manager = CheckpointManager(str(tmp_path), async_save=False)
+        manager.save_checkpoint(
+            _make_model(), step=1, epoch=0, metrics={"perplexity": float("inf")}
+        )
+
+        reloaded = CheckpointManager(str(tmp_path))
+
+        assert reloaded.best_metric == float("inf")
+        assert reloaded.list_checkpoints()[0]["metrics"]["perplexity"] == float("inf")
+
+    def test_legacy_json_history_is_read(self, tmp_path):
+        """Test history written as a single JSON document still loads."""
+        checkpoint = tmp_path / "checkpoint_step_5_epoch_1.pt"
+        torch.save({"step": 5}, checkpoint)
+        legacy = {
+            "checkpoint_history": [{"path": str(checkpoint), "step": 5, "epoch": 1}],
+            "best_metric": 0.25,
+            "best_checkpoint_path": str(checkpoint),
+        }
+        (tmp_path / "checkpoint_history.json").write_text(json.dumps(legacy))
+
+        manager = CheckpointManager(str(tmp_path))
+
+        assert manager.get_latest_checkpoint() == str(checkpoint)
+        assert manager.best_metric == 0.25
+
+        # Migrated entries survive saves made after the upgrade
+        manager.save_checkpoint(_make_model(), step=6, epoch=1, metrics={})
+        manager.flush()
+        reloaded = CheckpointManager(str(tmp_path))
+
+        assert [info["step"] for info in reloaded.list_checkpoints()] == [6, 5]
+        assert reloaded.best_checkpoint_path == str(checkpoint)
+        assert not (tmp_path / "checkpoint_history.json").exists()
+
+
+class TestDeltaCheckpoints:
+    """Test incremental checkpoints that reference unchanged tensors."""
+
+    def test_delta_round_trip_and_cleanup(self, tmp_path):
+        """Test deltas store only changed tensors and keep their sources alive."""
+        model = _make_model()
+        manager = CheckpointManager(
+            str(tmp_path), max_checkpoints=1, delta_checkpoints=True, async_save=False
+        )
+
+        first = manager.save_checkpoint(model, step=1, epoch=0, metrics={})
+        with torch.no_grad():
+            model[2].weight.add_(1.0)
+        second = manager.save_checkpoint(model, step=2, epoch=0, metrics={})
+
+        raw = torch.load(second, map_location="cpu")
+        assert set(raw["model_state_dict"]) == {"2.weight"}
+        assert set(raw["delta_manifest"]) == {"0.weight", "0.bias", "2.bias"}
+
+        # The first checkpoint is past max_checkpoints but still referenced
+        assert Path(first).exists()
+        loaded = manager.load_checkpoint(second)["model_state_dict"]
+        for name, tensor in model.state_dict().items():
+            assert torch.equal(loaded[name], tensor)
+
+    def test_full_every_n_anchors(self, tmp_path):
+        """Test every Nth save writes the complete state dict."""
+        model = _make_model()
+        manager = CheckpointManager(
+            str(tmp_path), delta_checkpoints=True, full_every_n=2, async_save=False
+        )
+
+        paths = [
+            manager.save_checkpoint(model, step=step, epoch=0, metrics={})
+            for step in range(3)
+        ]
+
+        assert "delta_manifest" in torch.load(paths[1], map_location="cpu")
+        assert "delta_manifest" not in torch.load(paths[2], map_location="cpu")
+
+
+class TestPerTensorFormat:
+    """Test the one-file-per-tensor checkpoint directory layout."""
+
+    def test_round_trip_with_optimizer(self, tmp_path):
+        """Test model and optimizer state survive the directory layout."""
+        model = _make_model().to(torch.bfloat16)
+        optimizer = torch.optim.AdamW(model.parameters())
+        _train_step(model, optimizer)
+        manager = CheckpointManager(
+            str(tmp_path), checkpoint_format="per_tensor", async_save=False
+        )
+
+        path = manager.save_checkpoint(
+            model, step=3, epoch=0, metrics={"loss": float("inf")}, optimizer=optimizer
+        )
+        restored = _make_model().to(torch.bfloat16)
+        restored_optimizer = torch.optim.AdamW(restored.parameters())
+        data = manager.resume_training(
+            restored, restored_optimizer, checkpoint_path=path
+        )
+
+        assert Path(path, "meta.json").is_file()
+        assert data["metrics"]["loss"] == float("inf")
+        for name, tensor in model.state_dict().items():
+            assert torch.equal(restored.state_dict()[name], tensor)
+        assert torch.equal(
+            restored_optimizer.state_dict()["state"][0]["exp_avg"],
+            optimizer.state_dict()["state"][0]["exp_avg"],
+        )
+
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA required")
+    def test_pipelined_load_into_cuda_model(self, tmp_path):
+        """Test streaming a per-tensor checkpoint into CUDA parameters."""
+        model = _make_model()
+        manager = CheckpointManager(
+            str(tmp_path), checkpoint_format="per_tensor", async_save=False
+        )
+        path = manager.save_checkpoint(model, step=1, epoch=0, metrics={})
+
+        restored = nn.Sequential(nn.Linear(4, 8), nn.ReLU(), nn.Linear(8, 2)).cuda()
+        data = manager.load_model_from_checkpoint(restored, path)
+
+        assert "model_state_dict" not in data
+        assert data["step"] == 1
+        for name, tensor in model.state_dict().items():
+            assert torch.equal(restored.state_dict()[name].cpu(), tensor)
+
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA required")
+    def test_parallel_load_into_cuda_model(self, tmp_path):
+        """Test multi-stream loading matches the saved state."""
+        model = _make_model()
+        manager = CheckpointManager(str(tmp_path), async_save=False)
+        path = manager.save_checkpoint(model, step=1, epoch=0, metrics={})
+
+        restored = nn.Sequential(nn.Linear(4, 8), nn.ReLU(), nn.Linear(8, 2)).cuda()
+        manager.load_model_from_checkpoint_parallel(restored, path)
+
+        for name, tensor in model.state_dict().items():
+            assert torch.equal(restored.state_dict()[name].cpu(), tensor)
+
+    def test_parallel_load_falls_back_on_cpu(self, tmp_path):
+        """Test CPU models use the regular loader and strict checks."""
+        manager = CheckpointManager(str(tmp_path), async_save=False)
+        path = manager.save_checkpoint(_make_model(), step=1, epoch=0, metrics={})
+
+        restored = nn.Sequential(nn.Linear(4, 8), nn.ReLU(), nn.Linear(8, 2))
+        data = manager.load_model_from_checkpoint_parallel(restored, path)
+
+        assert data["step"] == 1
+        with pytest.raises(RuntimeError):
+            manager.load_model_from_checkpoint_parallel(nn.Linear(4, 8), path)
+
+    def test_unknown_format_rejected(self, tmp_path):
+        """Test an unsupported checkpoint_format raises."""
+        with pytest.raises(ValueError):
+            CheckpointManager(str(tmp_path), checkpoint_format="zip")
+
+
+class TestCheckpointInfo:
+    """Test reading checkpoint metadata without loading tensors."""
+
+    @pytest.mark.parametrize("checkpoint_format", ["torch", "per_tensor"])
+    def test_info_skips_tensor_load(self, tmp_path, checkpoint_format):
+        """Test info comes from the pickle record or index, not a full load."""
+        model = _make_model()
+        optimizer = torch.optim.AdamW(model.parameters())
+        _train_step(model, optimizer)
+        manager = CheckpointManager(
+            str(tmp_path), checkpoint_format=checkpoint_format, async_save=False
+        )
+        path = manager.save_checkpoint(
+            model, step=4, epoch=2, metrics={"loss": 0.25}, optimizer=optimizer
+        )
+
+        with patch.object(manager, "_read_checkpoint") as full_load:
+            info = manager.get_checkpoint_info(path)
+
+        full_load.assert_not_called()
+        assert (info["step"], info["epoch"]) == (4, 2)
+        assert info["metrics"] == {"loss": 0.25}
+        assert info["has_optimizer"]
+        assert info["file_size"] > 0
+
+    def test_numpy_metrics_skip_tensor_load(self, tmp_path):
+        """Test NumPy scalar metrics do not force the full-load fallback."""
+        manager = CheckpointManager(str(tmp_path))
+        metrics = {"loss": np.float64(0.25), "count": np.int64(3)}
+        path = manager.save_checkpoint(_make_model(), step=4, epoch=2, metrics=metrics)
+
+        with patch.object(manager, "_read_checkpoint") as full_load:
+            info = manager.get_checkpoint_info(path)
+
+        full_load.assert_not_called()
+        assert info["metrics"] == metrics
+        assert isinstance(info["metrics"]["loss"], np.float64)
+
+
+@pytest.mark.skipif(not HAS_SAFETENSORS, reason="safetensors required")
+class TestSafetensorsFormat:
+    """Test single-file safetensors checkpoints."""
+
+    def test_round_trip_with_optimizer(self, tmp_path):
+        """Test state in the header and tensors in the body survive a reload."""
+        model = _make_model()
+        optimizer = torch.optim.AdamW(model.parameters())
+        _train_step(model, optimizer)
+        manager = CheckpointManager(
+            str(tmp_path), checkpoint_format="safetensors", async_save=False
+        )
+
+        path = manager.save_checkpoint(
+            model, step=2, epoch=1, metrics={"loss": 0.5}, optimizer=optimizer
+        )
+        restored = _make_model()
+        restored_optimizer = torch.optim.AdamW(restored.parameters())
+        data = manager.resume_training(
+            restored, restored_optimizer, checkpoint_path=path
+        )
+
+        assert path.endswith(".safetensors")
+        assert (tmp_path / "best_checkpoint.safetensors").is_symlink()
+        assert data["step"] == 2
+        assert data["metrics"] == {"loss": 0.5}
+        assert restored_optimizer.state_dict()["state"][0]["step"] == 1
+        assert manager.get_checkpoint_info(path)["metrics"] == {"loss": 0.5}
+        for name, tensor in model.state_dict().items():
+            assert torch.equal(restored.state_dict()[name], tensor)
+
+    def test_delta_reads_referenced_tensors(self, tmp_path):
+        """Test delta safetensors checkpoints resolve unchanged tensors."""
+        model = _make_model()
+        manager = CheckpointManager(
+            str(tmp_path),
+            checkpoint_format="safetensors",
+            delta_checkpoints=True,
+            async_save=False,
+        )
+        manager.save_checkpoint(model, step=1, epoch=0, metrics={})
+        with torch.no_grad():
+            model[0].weight.add_(1.0)
+        path = manager.save_checkpoint(model, step=2, epoch=0, metrics={})
+
+        data = manager.load_checkpoint(path)
+
+        for name, tensor in model.state_dict().items():
+            assert torch.equal(data["model_state_dict"][name], tensor)
+
+
+@pytest.mark.skipif(not HAS_ZSTD, reason="zstandard required")
+class TestCompressedCheckpoints:
+    """Test zstd-compressed torch checkpoints."""
+
+    def test_compressed_round_trip(self, tmp_path):
+        """Test compressed files are detected on load, info and delta reads."""
+        model = _make_model()
+        manager = CheckpointManager(
+            str(tmp_path), compress=True, delta_checkpoints=True, async_save=False
+        )
+        manager.save_checkpoint(model, step=1, epoch=0, metrics={"loss": 1.0})
+        with torch.no_grad():
+            model[2].bias.add_(1.0)
+        path = manager.save_checkpoint(model, step=2, epoch=0, metrics={"loss": 2.0})
+
+        assert Path(path).read_bytes()[:4] == b"\x28\xb5\x2f\xfd"
+        assert manager.get_checkpoint_info(path)["metrics"] == {"loss": 2.0}
+        loaded = manager.load_checkpoint(path)
+        for name, tensor in model.state_dict().items():
+            assert torch.equal(loaded["model_state_dict"][name], tensor)
+
+    def test_compress_requires_torch_format(self, tmp_path):
+        """Test compression is rejected for formats it does not apply to."""
+        with pytest.raises(ValueError):
+            CheckpointManager(
+                str(tmp_path), compress=True, checkpoint_format="per_tensor"
+            )
+
+
+class TestExport:
+    """Test exporting checkpoints for deployment."""
+
+    def test_state_dict_export_skips_model(self, tmp_path):
+        """Test the checkpoint state is re-emitted without loading the model."""
+        model = _make_model()
+        manager = CheckpointManager(str(tmp_path / "ckpt"), async_save=False)
+        path = manager.save_checkpoint(model, step=1, epoch=0, metrics={})
+
+        # A mismatched model would fail load_state_dict if it were used
+        export_path = tmp_path / "export" / "model.pt"
+        manager.export_model(
+            nn.Linear(1, 1), str(export_path), path, export_format="state_dict"
+        )
+
+        exported = torch.load(export_path)
+        assert exported.keys() == model.state_dict().keys()
+        for name, tensor in model.state_dict().items():
+            assert torch.equal(exported[name], tensor)
+
+
+class TestPrefetch:
+    """Test page-cache warm-up before loading."""
+
+    def test_prefetch_tolerates_empty_and_missing_files(self, tmp_path):
+        """Test prefetching is best effort and never raises."""
+        (tmp_path / "data.bin").write_bytes(b"\0" * 4096)
+        (tmp_path / "empty.bin").write_bytes(b"")
+
+        _prefetch_to_page_cache(
+            [tmp_path / "data.bin", tmp_path / "empty.bin", tmp_path / "missing.bin"]
+        )
+
+
+@pytest.mark.skipif(not HAS_DCP, reason="torch.distributed.checkpoint not available")
+class TestDistributedCheckpoint:
+    """Test sharded saves through torch.distributed.checkpoint."""
+
+    @pytest.fixture
+    def process_group(self, tmp_path):
+        dist.init_process_group(
+            "gloo", init_method=f"file://{tmp_path / 'pg'}", rank=0, world_size=1
+        )
+        yield
+        dist.destroy_process_group()
+
+    @pytest.mark.parametrize("async_save", [False, True])
+    def test_round_trip(self, tmp_path, process_group, async_save):
+        """Test a sharded checkpoint restores model and optimizer state."""
+        model = _make_model()
+        optimizer = torch.optim.AdamW(model.parameters())
+        _train_step(model, optimizer)
+        manager = CheckpointManager(
+            str(tmp_path / "ckpt"), use_dcp=True, async_save=async_save
+        )
+
+        path = manager.save_checkpoint(
+            model, step=7, epoch=1, metrics={"loss": 0.5}, optimizer=optimizer
+        )
+        manager.flush()
+        restored = nn.Sequential(nn.Linear(4, 8), nn.ReLU(), nn.Linear(8, 2))
+        restored_optimizer = torch.optim.AdamW(restored.parameters())
+        data = manager.resume_training(
+            restored, restored_optimizer, checkpoint_path=path
+        )
+
+        assert path.endswith("step_7")
+        assert (Path(path) / "trainer_state.pt").exists()
+        assert data["step"] == 7
+        for name, tensor in model.state_dict().items():
+            assert torch.equal(restored.state_dict()[name], tensor)
+        assert restored_optimizer.state_dict()["state"].keys() == (
+            optimizer.state_dict()["state"].keys()
+        )
+
+    def test_blocking_save_without_cpu_backend(self, tmp_path, process_group):
+        """Test async saves block when the group cannot reduce CPU tensors."""
+        manager = CheckpointManager(
+            str(tmp_path / "ckpt"), use_dcp=True, async_save=True
+        )
+
+        with patch(
+            "hyena_glt.training.checkpointing._has_cpu_collectives",
+            return_value=False,
+        ):
+            path = manager.save_checkpoint(_make_model(), step=3, epoch=0, metrics={})
+
+        assert not manager._pending_saves
+        assert (Path(path) / ".metadata").exists()
+
+    def test_failed_sharded_write_is_not_recorded(self, tmp_path, process_group):
+        """Test history and best tracking wait for the sharded write."""
+        manager = CheckpointManager(
+            str(tmp_path / "ckpt"), use_dcp=True, async_save=True
+        )
+        write: Future[None] = Future()
+        write.set_exception(OSError("disk full"))
+
+        with patch("torch.distributed.checkpoint.async_save", return_value=write):
+            manager.save_checkpoint(
+                _make_model(), step=3, epoch=0, metrics={"loss": 1.0}
+            )
+            with pytest.raises(OSError):
+                manager.flush()
+
+        assert not manager.checkpoint_history
+        assert manager.best_checkpoint_path is None
+        assert not list((tmp_path / "ckpt").rglob("trainer_state.pt*"))
+
+    def test_single_file_by_default(self, tmp_path, process_group):
+        """Test distributed runs keep the single-file layout unless use_dcp."""
+        manager = CheckpointManager(str(tmp_path / "ckpt"))
+
+        path = manager.save_checkpoint(_make_model(), step=3, epoch=0, metrics={})
+
+        assert Path(path).is_file()
+
+    def test_incomplete_sharded_save_removed_on_startup(self, tmp_path):
+        """Test a step directory without trainer state is treated as partial."""
+        (tmp_path / "step_4").mkdir()
+        (tmp_path / "step_4" / "__0_0.distcp").write_bytes(b"torn")
+
+        CheckpointManager(str(tmp_path))
+
+        assert not (tmp_path / "step_4").exists()